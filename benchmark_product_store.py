@@ -0,0 +1,156 @@
+import argparse
+import copy
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+
+from product_store import FIELDS, ProductStore
+
+CATEGORIES = ['Produce', 'Meat & Seafood', 'Dairy', 'Bakery', 'Frozen', 'Pantry']
+UNITS = ['Per Lb.', 'Each', 'Per Pkg.', '']
+DESCRIPTIONS = ['', '30 oz.', '16 oz.', 'Family Pack', 'Assorted Varieties']
+MIN_ITEMS = 100000
+
+
+def fresh(s):
+    """Return a new string object equal to `s`, as json.load gives for every item."""
+    # without the copy CPython hands each row the same constant object, hiding the cost of the dicts
+    return ''.join(list(s))
+
+
+def fake_items(count, seed=0):
+    """Yield rows shaped like parsed flyer items."""
+    rng = random.Random(seed)
+    for i in range(count):
+        yield (
+            f"Product {i}",
+            fresh(rng.choice(DESCRIPTIONS)),
+            f"${rng.randint(1, 2000) / 100:.2f}",
+            fresh(rng.choice(UNITS)),
+            fresh(rng.choice(CATEGORIES)),
+        )
+
+
+def write_dump(sample_json, count, path):
+    """Write a flyer dump of `count` items copied from `sample_json`, each with a unique name."""
+    with open(sample_json, 'r', encoding='utf-8') as f:
+        sample = json.load(f)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('[')
+        for i in range(count):
+            item = copy.deepcopy(sample[i % len(sample)])
+            item['name'] = f"{item.get('name', '')} #{i}"
+            # brave_brochure_parser reads categories[0]
+            item['categories'] = item.get('categories') or ['Other']
+            if i:
+                f.write(',')
+            json.dump(item, f)
+        f.write(']')
+
+
+def max_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def run_rows(mode, count):
+    start = max_rss_mb()
+    if mode == 'dicts':
+        output = []
+        for row in fake_items(count):
+            output.append(dict(zip(FIELDS, row)))
+    else:
+        output = ProductStore()
+        for row in fake_items(count):
+            output.append(*row)
+    print(max_rss_mb() - start)
+
+
+def run_parser(parser_name, dump, src):
+    sys.path.insert(0, src)
+    import brave_brochure_parser
+    import intelligent_brochure_parser
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_csv = os.path.join(tmp, 'out.csv')
+        start = max_rss_mb()
+        if parser_name == 'brave':
+            brave_brochure_parser.parse_json_to_csv(dump, output_csv)
+        else:
+            with open(os.path.join(src, 'mapping.json'), 'r', encoding='utf-8') as mf:
+                mapping = json.load(mf)
+            intelligent_brochure_parser.parse_json_with_mapping(dump, output_csv, mapping, max_rows=None)
+        print(max_rss_mb() - start)
+
+
+def measure(*args):
+    out = subprocess.run([sys.executable, __file__, *args], capture_output=True, text=True, check=True)
+    # the parsers print a summary line before the measurement
+    return float(out.stdout.splitlines()[-1])
+
+
+def print_results(results, per_million):
+    print(f"{'run':<24}{'RSS MB / million items':>26}")
+    for name, mb in results.items():
+        print(f"{name:<24}{mb * per_million:>26.1f}")
+
+
+def min_items(value):
+    count = int(value)
+    if count < MIN_ITEMS:
+        raise argparse.ArgumentTypeError(f"need at least {MIN_ITEMS} items for a meaningful RSS reading")
+    return count
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Compare peak RSS of list-of-dicts rows against ProductStore.")
+    parser.add_argument("--items", type=min_items, default=1000000, help="Number of items to build")
+    parser.add_argument("--parsers", action="store_true",
+                        help="Also measure the real parsers on a generated dump of --items items")
+    parser.add_argument("--sample", default=os.path.join(here, "parseText.json"),
+                        help="Flyer JSON whose items are copied into the generated dump")
+    parser.add_argument("--baseline", help="Checkout of an older revision to measure the parsers against")
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    parser.add_argument("--dump", help=argparse.SUPPRESS)
+    parser.add_argument("--src", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode in ('dicts', 'store'):
+        run_rows(args.mode, args.items)
+        return
+    if args.mode:
+        run_parser(args.mode, args.dump, args.src)
+        return
+
+    # every run is in its own process so peak RSS is not shared
+    per_million = 1000000 / args.items
+    results = {mode: measure("--mode", mode, "--items", str(args.items)) for mode in ['dicts', 'store']}
+    print_results(results, per_million)
+    if results['store'] > 0:
+        print(f"reduction: {results['dicts'] / results['store']:.1f}x")
+
+    if not args.parsers:
+        return
+    sources = {'current': here}
+    if args.baseline:
+        sources = {'baseline': args.baseline, **sources}
+    with tempfile.TemporaryDirectory() as tmp:
+        dump = os.path.join(tmp, 'dump.json')
+        write_dump(args.sample, args.items, dump)
+        print(f"\ndump: {args.items} items, {os.path.getsize(dump) / (1024 * 1024):.0f} MB")
+        results = {}
+        for label, src in sources.items():
+            for parser_name in ['brave', 'intelligent']:
+                results[f"{parser_name} ({label})"] = measure(
+                    "--mode", parser_name, "--dump", dump, "--src", src, "--items", str(args.items))
+        print_results(results, per_million)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,9 @@
-import json
-import csv
+from json_stream import iter_json_items
+from product_store import ProductStore
 
 def parse_json_to_csv(json_path, output_csv):
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    output = []
-    for item in data:
+    output = ProductStore()
+    for item in iter_json_items(json_path):
         name = item.get('name', '').strip()
         description = (item.get('description') or '').strip()
         pre_price = (item.get('pre_price_text') or '').strip()
@@ -35,19 +32,16 @@ def parse_json_to_csv(json_path, output_csv):
 
         category = item.get('categories', [''])[0]
 
-        output.append({
-            'name': name,
-            'description': description,
-            'price': final_price,
-            'price_per_unit': price_per_unit,
-            'category': category
-        })
+        output.append(
+            name=name,
+            description=description,
+            price=final_price,
+            price_per_unit=price_per_unit,
+            category=category
+        )
 
     # writing to csv
-    with open(output_csv, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=output[0].keys())
-        writer.writeheader()
-        writer.writerows(output)
+    output.write_csv(output_csv)
 
     print(f"Parsed {len(output)} products into {output_csv}")
 
@@ -1,6 +1,9 @@
 import json
-import csv
 import argparse
+from itertools import islice
+
+from json_stream import iter_json_items
+from product_store import FIELDS, ProductStore
 
 def extract_field(item, field_mapping, field_name):
     keys = field_mapping.get(field_name, [])
@@ -20,30 +23,18 @@ def extract_field(item, field_mapping, field_name):
     return ""
 
 def parse_json_with_mapping(json_file, output_csv, field_mapping, max_rows=1000):
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    # Handle wrapped list in {"data": [...]} etc.
-    if isinstance(data, dict):
-        for val in data.values():
-            if isinstance(val, list):
-                data = val
-                break
-
-    output_rows = []
-    for item in data[:max_rows]:
+    # Streams items, unwrapping {"data": [...]} etc., so the whole dump is never in memory
+    output_rows = ProductStore()
+    for item in islice(iter_json_items(json_file), max_rows):
         row = {}
-        for field in ['name', 'description', 'price', 'price_per_unit', 'category']:
+        for field in FIELDS:
             row[field] = extract_field(item, field_mapping, field)
         # if row['price']:
         #     row['price'] = row['price'].replace('$', '').strip()
         if row['price'] != "":
-            output_rows.append(row)
+            output_rows.append(**row)
 
-    with open(output_csv, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=['name', 'description', 'price', 'price_per_unit', 'category'])
-        writer.writeheader()
-        writer.writerows(output_rows)
+    output_rows.write_csv(output_csv)
 
     print(f"Successfully wrote {len(output_rows)} rows to {output_csv}")
 
@@ -0,0 +1,93 @@
+import json
+
+_WHITESPACE = ' \t\n\r'
+# characters that can legally follow a complete value
+_VALUE_END = _WHITESPACE + ',]}:'
+
+
+class _Buffer:
+    """Chunked reader that raw-decodes one JSON value at a time."""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos} of JSON chunk")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                val, end = self.decoder.raw_decode(self.buf, self.pos)
+                # a number split at a chunk edge decodes short ("12." -> 12), so only
+                # trust a value that is followed by a delimiter or ends the file
+                if self.eof or (end < len(self.buf) and self.buf[end] in _VALUE_END):
+                    self.pos = end
+                    return val
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def array_items(self):
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ',':
+                self.pos += 1
+                continue
+            self.expect(']')
+            return
+
+
+def iter_json_items(json_path, chunk_size=1 << 16):
+    """Yield the items of a flyer JSON dump one at a time without loading the whole file.
+
+    The dump is either a list of items or an object wrapping one, like {"data": [...]};
+    in that case the first list-valued key is used.
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        reader = _Buffer(f, chunk_size)
+        if reader.peek() == '[':
+            yield from reader.array_items()
+            return
+
+        reader.expect('{')
+        while reader.peek() not in ('}', ''):
+            reader.value()
+            reader.expect(':')
+            if reader.peek() == '[':
+                yield from reader.array_items()
+                return
+            reader.value()
+            if reader.peek() == ',':
+                reader.pos += 1
+        raise ValueError(f"No list of items found in {json_path}")
@@ -0,0 +1,59 @@
+import csv
+from array import array
+
+FIELDS = ['name', 'description', 'price', 'price_per_unit', 'category']
+# low-cardinality fields; name and description are mostly unique and stay plain lists
+ENCODED_FIELDS = ('price', 'price_per_unit', 'category')
+
+
+class _EncodedColumn:
+    """String column stored as an array of codes into a table of unique values."""
+
+    __slots__ = ('codes', 'values', '_index')
+
+    def __init__(self):
+        self.codes = array('I')
+        self.values = []
+        self._index = {}
+
+    def append(self, value):
+        code = self._index.get(value)
+        if code is None:
+            code = len(self.values)
+            self._index[value] = code
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __iter__(self):
+        values = self.values
+        for code in self.codes:
+            yield values[code]
+
+
+class ProductStore:
+    """Compact column store for parsed flyer items.
+
+    Price, unit and category are dictionary-encoded, so each distinct string
+    ("Per Lb.", "Produce", "$2.99", ...) is kept once and a row only adds a code.
+    """
+
+    __slots__ = ('_columns',)
+
+    def __init__(self):
+        self._columns = tuple(_EncodedColumn() if field in ENCODED_FIELDS else [] for field in FIELDS)
+
+    def append(self, name, description, price, price_per_unit, category):
+        for column, value in zip(self._columns, (name, description, price, price_per_unit, category)):
+            column.append(value)
+
+    def __len__(self):
+        return len(self._columns[0])
+
+    def __iter__(self):
+        return zip(*self._columns)
+
+    def write_csv(self, output_csv):
+        with open(output_csv, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(FIELDS)
+            writer.writerows(self)
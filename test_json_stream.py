@@ -0,0 +1,43 @@
+import json
+
+import pytest
+
+from json_stream import iter_json_items
+
+ITEMS = [
+    {"name": "Tyson Fresh Chicken Wings", "price_text": "2.99", "post_price_text": "Per Lb.",
+     "categories": ["Meat & Seafood"], "weight": 12.5, "rank": 1.5e-3, "tags": [], "sale": None},
+    {"name": "ALDI Coleslaw", "description": "30 oz.", "price_text": "1.49", "categories": [],
+     "count": -40, "on_sale": True},
+    {"name": "Café \"Blend\"", "nested": {"a": [1, 2.25, {"b": False}]}, "price_text": ""},
+]
+
+
+def write(tmp_path, data, **dump_kwargs):
+    path = tmp_path / "dump.json"
+    path.write_text(json.dumps(data, **dump_kwargs), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("data, dump_kwargs", [
+    (ITEMS, {}),
+    (ITEMS, {"indent": 2}),
+    ({"meta": {"region": "NYC", "pages": [1, 2]}, "count": 1.5e3, "data": ITEMS}, {}),
+    ([], {}),
+])
+def test_matches_json_load_at_every_chunk_size(tmp_path, data, dump_kwargs):
+    path = write(tmp_path, data, **dump_kwargs)
+    expected = data["data"] if isinstance(data, dict) else data
+    for chunk_size in range(1, 80):
+        assert list(iter_json_items(path, chunk_size=chunk_size)) == expected, chunk_size
+
+
+def test_number_split_at_default_chunk_edge(tmp_path):
+    path = write(tmp_path, {"pad": "x" * 65505, "total_weight": 12.5, "data": ITEMS})
+    assert list(iter_json_items(path)) == ITEMS
+
+
+def test_wrapper_without_list_raises(tmp_path):
+    path = write(tmp_path, {"count": 0})
+    with pytest.raises(ValueError):
+        list(iter_json_items(path))